@@ -1,20 +1,18 @@
+import asyncio
 import os
 import tempfile
 from pathlib import Path
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
+import aiofiles
+import orjson
 
-from ddq_validator.extract import load_questions, load_questions_pdf
-from ddq_validator.llm import llm_refine_findings
-from ddq_validator.models import Finding
-from ddq_validator.redact import redact_rows
-from ddq_validator.report import write_report
-from ddq_validator.rules import RuleConfig, should_validate, validate_row
+from ddq_validator.pipeline import REDACT_REQUIRED_FOR_LLM, NoRowsExtractedError, run_validation
 
 
 load_dotenv()
@@ -34,62 +32,50 @@ app.add_middleware(
 
 frontend_dir = (Path(__file__).parent / "frontend").resolve()
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+# /validate is synchronous, so a Batch API run cannot wait out its 24h completion window.
+# After this many seconds the deterministic results are returned instead.
+BATCH_API_MAX_WAIT = 240.0
+
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
-def _validate_rows(rows, use_llm: bool, llm_model: str) -> List[Finding]:
-    cfg = RuleConfig.default()
-    findings: List[Finding] = []
-    results: List[Finding] = []
-
-    for row in rows:
-        if not should_validate(row):
-            results.append(
-                Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="SKIPPED",
-                    reason="Row is not a question or validation rule does not apply.",
-                    details={"validated": False},
-                )
-            )
-            continue
-
-        fnd = validate_row(row, cfg)
-        if fnd is not None:
-            findings.append(fnd)
-            results.append(fnd)
-        else:
-            results.append(
-                Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="OK",
-                    reason="Passed rule checks.",
-                    details={"validated": True},
-                )
-            )
-
-    if use_llm and findings:
-        refined = llm_refine_findings(findings, model=llm_model)
-        refined_map = {(f.sheet, f.row_idx, f.question_id): f for f in refined}
-        results = [
-            refined_map.get((r.sheet, r.row_idx, r.question_id), r)
-            for r in results
-        ]
-
-    return results
+def _validate_file(
+    filled_path: Path,
+    max_rows: Optional[int],
+    use_llm: bool,
+    llm_model: str,
+    use_batch_api: bool,
+    redact: bool,
+) -> bytes:
+    """Extract, validate and report one uploaded file; returns the JSON response body."""
+
+    try:
+        # Build the report in memory; the response embeds the file contents directly.
+        report_result = run_validation(
+            filled_path,
+            None,
+            use_llm,
+            llm_model,
+            max_rows,
+            use_batch_api=use_batch_api,
+            batch_max_wait=BATCH_API_MAX_WAIT,
+            redact=redact,
+        )
+    except NoRowsExtractedError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    payload = {
+        "summary": report_result["summary"],
+        "report": [r.to_dict() for r in report_result["results"]],
+        "report_csv": report_result["report_csv"],
+        "summary_json": report_result["summary_json"],
+    }
+    # Serialize with orjson directly instead of jsonable_encoder + json.dumps.
+    return orjson.dumps(payload)
 
 
 @app.post("/validate")
@@ -97,6 +83,8 @@ async def validate(
     file: UploadFile = File(...),
     use_llm: bool = Form(False),
     llm_model: str = Form("gpt-5.2"),
+    use_batch_api: bool = Form(False),
+    redact: bool = Form(True),
     max_rows_per_sheet: int = Form(0),
 ):
     if not file.filename:
@@ -106,45 +94,30 @@ async def validate(
     if suffix not in {".xlsx", ".pdf"}:
         raise HTTPException(status_code=400, detail="Only XLSX or PDF files are supported.")
 
+    if use_llm and not redact:
+        raise HTTPException(status_code=400, detail=REDACT_REQUIRED_FOR_LLM)
+
     max_rows: Optional[int] = None if max_rows_per_sheet <= 0 else max_rows_per_sheet
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp_path = Path(tmp_dir)
         filled_path = tmp_path / f"filled{suffix}"
-        filled_path.write_bytes(await file.read())
-
-        if suffix == ".pdf":
-            rows = load_questions_pdf(
-                filled_path=str(filled_path),
-                max_rows_per_sheet=max_rows,
-            )
-        else:
-            rows = load_questions(
-                filled_path=str(filled_path),
-                max_rows_per_sheet=max_rows,
-            )
-        rows = redact_rows(rows)
-
-        if not rows:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    "No rows were extracted. Check that the filled file uses the expected "
-                    "column layout (A=ID, B=Question, C=Answer)."
-                ),
-            )
-
-        results = _validate_rows(rows, use_llm=use_llm, llm_model=llm_model)
-        report_result = write_report(results, tmp_path)
-        report_csv = Path(report_result["report_csv"]).read_text(encoding="utf-8")
-        summary_json = Path(report_result["summary_json"]).read_text(encoding="utf-8")
-
-        return {
-            "summary": report_result["summary"],
-            "report": [r.to_dict() for r in results],
-            "report_csv": report_csv,
-            "summary_json": summary_json,
-        }
+        # Stream the upload to disk instead of buffering the whole file in memory.
+        async with aiofiles.open(filled_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await out.write(chunk)
+
+        # Extraction and validation are blocking; keep the event loop free for other requests.
+        body = await asyncio.to_thread(
+            _validate_file,
+            filled_path,
+            max_rows,
+            use_llm,
+            llm_model,
+            use_batch_api,
+            redact,
+        )
+        return Response(content=body, media_type="application/json")
 
 
 @app.get("/")
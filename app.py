@@ -1,13 +1,15 @@
-import os
-import sys
+import contextlib
+import io
 import tempfile
-import subprocess
+import traceback
 from pathlib import Path
 
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
 
+from ddq_validator.pipeline import run_validation
+
 
 load_dotenv()
 st.set_page_config(page_title="DDQ Validator", layout="wide")
@@ -49,21 +51,15 @@ if run_btn:
         out_dir.mkdir(parents=True, exist_ok=True)
 
         st.info("Running validation…")
-        cmd = [
-            sys.executable, "-m", "ddq_validator.cli",
-            "--filled", str(filled_path),
-            "--out-dir", str(out_dir),
-        ]
-        if mode == "LLM (OpenAI)":
-            cmd.extend(["--use-llm", "--llm-model", llm_model])
-
-        # Run the validator
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-
-        if proc.returncode != 0:
+        stderr = io.StringIO()
+
+        # Run the validator in-process (no interpreter start-up / re-imports per click)
+        try:
+            with contextlib.redirect_stderr(stderr):
+                result = run_validation(filled_path, out_dir, mode == "LLM (OpenAI)", llm_model, None)
+        except Exception:
             st.error("Validator failed.")
-            st.code(proc.stdout or "", language="text")
-            st.code(proc.stderr or "", language="text")
+            st.code(stderr.getvalue() + traceback.format_exc(), language="text")
             st.stop()
 
         report_csv = out_dir / "report.csv"
@@ -71,7 +67,7 @@ if run_btn:
 
         if not report_csv.exists():
             st.error("No report.csv produced. Check validator output below.")
-            st.code(proc.stdout or "", language="text")
+            st.code(stderr.getvalue() or "(no stderr)", language="text")
             st.stop()
 
         # Show results
@@ -101,6 +97,9 @@ if run_btn:
 
         # Logs (optional)
         with st.expander("Show validator logs"):
-            st.code(proc.stdout or "(no stdout)", language="text")
-            st.code(proc.stderr or "(no stderr)", language="text")
+            summary = result["summary"]
+            lines = [f"Flagged rows: {summary['total_flagged']}", "By status:"]
+            lines += [f"  - {k}: {v}" for k, v in summary["by_status"].items()]
+            st.code("\n".join(lines), language="text")
+            st.code(stderr.getvalue() or "(no stderr)", language="text")
 
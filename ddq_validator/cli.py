@@ -1,18 +1,12 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 import typer
 from dotenv import load_dotenv
 from rich import print
 
-from .extract import load_questions, load_questions_pdf
-from .models import Finding
-from .redact import redact_rows
-from .rules import RuleConfig, should_validate, validate_row
-from .llm import llm_refine_findings
-from .report import write_report
+from .pipeline import REDACT_REQUIRED_FOR_LLM, run_validation
 
 load_dotenv()
 app = typer.Typer(add_completion=False, no_args_is_help=True)
@@ -24,6 +18,15 @@ def validate(
     out_dir: str = typer.Option("output", help="Output directory for report.csv and summary.json"),
     use_llm: bool = typer.Option(False, help="Refine flagged rows using an LLM (requires OPENAI_API_KEY)"),
     llm_model: str = typer.Option("gpt-5.2", help="OpenAI model name"),
+    use_batch_api: bool = typer.Option(
+        False,
+        help="With --use-llm: submit all flagged rows via the OpenAI Batch API (cheaper, minutes-scale latency)",
+    ),
+    redact: bool = typer.Option(
+        True,
+        "--redact/--no-redact",
+        help="Redact person names before validation/reporting (--no-redact is faster, but names stay in the report)",
+    ),
     max_rows_per_sheet: int = typer.Option(0, help="Debug: limit max rows per sheet (0 = no limit)"),
 ):
     """Validate a filled DDQ against a reference workbook with model answers."""
@@ -32,75 +35,20 @@ def validate(
     if not filled_path.exists():
         raise typer.BadParameter(f"Filled file not found: {filled}")
 
-    max_rows = None if max_rows_per_sheet <= 0 else max_rows_per_sheet
-
-    if filled_path.suffix.lower() == ".pdf":
-        rows = load_questions_pdf(
-            filled_path=str(filled_path),
-            max_rows_per_sheet=max_rows,
-        )
-    else:
-        rows = load_questions(
-            filled_path=str(filled_path),
-            max_rows_per_sheet=max_rows,
-        )
-    rows = redact_rows(rows)
-    if not rows:
-        raise RuntimeError(
-            "No rows were extracted. Check that the filled file uses the expected "
-            "column layout (A=ID, B=Question, C=Answer)."
-        )
-
-    cfg = RuleConfig.default()
+    if use_llm and not redact:
+        raise typer.BadParameter(REDACT_REQUIRED_FOR_LLM, param_hint="--no-redact")
 
-    findings = []
-    results = []
-    for row in rows:
-        if not should_validate(row):
-            results.append(
-                Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="SKIPPED",
-                    reason="Row is not a question or validation rule does not apply.",
-                    details={"validated": False},
-                )
-            )
-            continue
-
-        fnd = validate_row(row, cfg)
-        if fnd is not None:
-            findings.append(fnd)
-            results.append(fnd)
-        else:
-            results.append(
-                Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="OK",
-                    reason="Passed rule checks.",
-                    details={"validated": True},
-                )
-            )
-
-    if use_llm and findings:
-        refined = llm_refine_findings(findings, model=llm_model)
-        refined_map = {(f.sheet, f.row_idx, f.question_id): f for f in refined}
-        findings = refined
-        results = [
-            refined_map.get((r.sheet, r.row_idx, r.question_id), r)
-            for r in results
-        ]
+    max_rows = None if max_rows_per_sheet <= 0 else max_rows_per_sheet
 
-    result = write_report(results, out_dir)
+    result = run_validation(
+        filled_path,
+        Path(out_dir),
+        use_llm,
+        llm_model,
+        max_rows,
+        use_batch_api=use_batch_api,
+        redact=redact,
+    )
 
     print("\n[bold]DDQ Validation Complete[/bold]")
     print(f"Flagged rows: [bold]{result['summary']['total_flagged']}[/bold]")
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import contextlib
+import datetime
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 import openpyxl
 import fitz
 import re
 
+try:  # optional: Rust-backed XLSX reader, much faster than openpyxl
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - fallback when the extra is not installed
+    CalamineWorkbook = None
+
 from .models import QuestionRow
 
 
@@ -20,6 +27,11 @@ class ColumnMap:
     expected_col: int = 4 # D (reference workbook)
 
 
+# A sheet is considered finished after this many consecutive empty rows. Sheets edited in
+# Excel often carry formatting far below the data, which would otherwise be scanned row by row.
+MAX_EMPTY_STREAK = 50
+
+
 def norm_str(v) -> str:
     if v is None:
         return ""
@@ -28,69 +40,147 @@ def norm_str(v) -> str:
     return s.strip()
 
 
+def _cell(row: tuple, col: int):
+    """1-based column lookup; streamed rows can be shorter than `max_col`."""
+
+    return row[col - 1] if col <= len(row) else None
+
+
+def _calamine_value(v):
+    """Map calamine cell values onto what openpyxl returns, so both readers give the same text."""
+
+    # calamine reports every number as float; openpyxl keeps whole numbers as int ("7", not "7.0")
+    if isinstance(v, float) and v.is_integer():
+        return int(v)
+    if isinstance(v, datetime.date) and not isinstance(v, datetime.datetime):
+        return datetime.datetime(v.year, v.month, v.day)
+    return v
+
+
+def _iter_sheets_calamine(filled_path: str, max_rows: int | None) -> Iterator[tuple[str, Iterable[tuple]]]:
+    wb = CalamineWorkbook.from_path(filled_path)
+    try:
+        for sheet in wb.sheet_names:
+            # skip_empty_area=False keeps row 1 at index 0 even if the data starts lower down
+            values = wb.get_sheet_by_name(sheet).to_python(skip_empty_area=False, nrows=max_rows)
+            yield sheet, (tuple(map(_calamine_value, row)) for row in values)
+    finally:
+        wb.close()
+
+
+def _iter_sheets_openpyxl(
+    filled_path: str, max_rows: int | None, max_col: int
+) -> Iterator[tuple[str, Iterable[tuple]]]:
+    # read_only streams the sheet XML instead of building the full cell graph
+    wb = openpyxl.load_workbook(filled_path, read_only=True, data_only=True)
+    try:
+        for sheet in wb.sheetnames:
+            ws = wb[sheet]
+            # Stored dimensions can be wrong (too small or too large); scan the actual rows instead.
+            ws.reset_dimensions()
+            yield sheet, ws.iter_rows(min_row=1, max_row=max_rows, max_col=max_col, values_only=True)
+    finally:
+        # read-only workbooks keep the file handle open until closed
+        wb.close()
+
+
 def load_questions(
     *,
     filled_path: str,
     colmap: ColumnMap | None = None,
     max_rows_per_sheet: int | None = None,
 ) -> List[QuestionRow]:
-    """Extract questions + answers from `filled_path` only."""
+    """Extract questions + answers from `filled_path` only.
+
+    Uses python-calamine when it is installed and falls back to openpyxl otherwise.
+    """
 
     colmap = colmap or ColumnMap()
-    wb_filled = openpyxl.load_workbook(filled_path)
+    max_col = max(colmap.qid_col, colmap.qtext_col, colmap.answer_col, colmap.expected_col)
+    if CalamineWorkbook is not None:
+        sheets = _iter_sheets_calamine(filled_path, max_rows_per_sheet)
+    else:
+        sheets = _iter_sheets_openpyxl(filled_path, max_rows_per_sheet, max_col)
 
     rows: List[QuestionRow] = []
 
-    for sheet in wb_filled.sheetnames:
-        ws_fill = wb_filled[sheet]
+    with contextlib.closing(sheets):
+        for sheet, values in sheets:
+            empty_streak = 0
+            for r, row in enumerate(values, start=1):
+                qid = norm_str(_cell(row, colmap.qid_col))
+                qtext = norm_str(_cell(row, colmap.qtext_col))
+                answer = norm_str(_cell(row, colmap.answer_col))
+                expected = norm_str(_cell(row, colmap.expected_col))
+
+                # Skip completely empty rows
+                if not qtext and not qid and not answer:
+                    empty_streak += 1
+                    if empty_streak >= MAX_EMPTY_STREAK:
+                        break
+                    continue
+                empty_streak = 0
+
+                rows.append(
+                    QuestionRow(
+                        sheet=sheet,
+                        row_idx=r,
+                        question_id=qid or None,
+                        question_text=qtext,
+                        answer_text=answer,
+                        expected_text=expected,
+                    )
+                )
 
-        max_row = ws_fill.max_row
-        if max_rows_per_sheet is not None:
-            max_row = min(max_row, max_rows_per_sheet)
+    return rows
 
-        for r in range(1, max_row + 1):
-            qid = norm_str(ws_fill.cell(r, colmap.qid_col).value)
-            qtext = norm_str(ws_fill.cell(r, colmap.qtext_col).value)
-            answer = norm_str(ws_fill.cell(r, colmap.answer_col).value)
-            expected = norm_str(ws_fill.cell(r, colmap.expected_col).value)
 
-            # Skip completely empty rows
-            if not qtext and not qid and not answer:
-                continue
+_QID_RE = re.compile(r"\b(\d+(?:\.\d+)+)\b")
+_HSPACE_RE = re.compile(r"[ \t]+")
+# Line boundaries as recognised by str.splitlines()
+_LINE_BREAK = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_FIRST_BREAK_RE = re.compile(f"[{_LINE_BREAK}]")
+_LAST_BREAK_RE = re.compile(f"(?s:.*)[{_LINE_BREAK}]")
 
-            rows.append(
-                QuestionRow(
-                    sheet=sheet,
-                    row_idx=r,
-                    question_id=qid or None,
-                    question_text=qtext,
-                    answer_text=answer,
-                    expected_text=expected,
-                )
-            )
 
-    return rows
+def _iter_qid_chunks(pages: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (qid, text up to the next qid) from page texts, streaming page by page.
+
+    Only the text from the last QID seen onwards is carried over to the next page, so the
+    full document text is never held in memory. Text before the first QID is dropped.
+    """
+
+    tail = ""
+    for page_text in pages:
+        # Keep line breaks to better separate question vs answer
+        page_text = _HSPACE_RE.sub(" ", page_text)
+        buf = f"{tail}\n{page_text}" if tail else page_text
+        matches = list(_QID_RE.finditer(buf))
+        if not matches:
+            tail = buf if tail else ""
+            continue
+        for m, nxt in zip(matches, matches[1:]):
+            yield m.group(1), buf[m.end():nxt.start()].strip()
+        # The last chunk may continue on the next page.
+        tail = buf[matches[-1].start():]
 
+    if tail:
+        m = _QID_RE.match(tail)
+        yield m.group(1), tail[m.end():].strip()
 
-def _pdf_text(path: str) -> str:
-    doc = fitz.open(path)
-    parts: List[str] = []
-    for page in doc:
-        parts.append(page.get_text("text"))
-    return "\n".join(parts)
 
+def _question_and_answer(chunk: str) -> tuple[str, str]:
+    """Question = first line, answer = last line of a stripped QID chunk.
 
-def _split_qid_chunks(text: str) -> List[tuple[str, str]]:
-    pattern = re.compile(r"\b(\d+(?:\.\d+)+)\b")
-    matches = list(pattern.finditer(text))
-    chunks: List[tuple[str, str]] = []
-    for i, m in enumerate(matches):
-        qid = m.group(1)
-        start = m.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        chunk = text[start:end].strip()
-        chunks.append((qid, chunk))
-    return chunks
+    The chunk has no blank edges, so its first and last lines are non-blank; only those two
+    lines are sliced out instead of splitting and stripping every line in between.
+    """
+
+    first = _FIRST_BREAK_RE.search(chunk)
+    if first is None:
+        return "", chunk
+    last = _LAST_BREAK_RE.match(chunk)
+    return chunk[:first.start()].strip(), chunk[last.end():].strip()
 
 
 def load_questions_pdf(
@@ -100,36 +190,24 @@ def load_questions_pdf(
 ) -> List[QuestionRow]:
     """Extract questions + answers from a filled PDF (best-effort, no reference needed)."""
 
-    raw_text = _pdf_text(filled_path)
-    # Keep line breaks to better separate question vs answer
-    raw_text = re.sub(r"[ \t]+", " ", raw_text)
-
-    chunks = _split_qid_chunks(raw_text)
     rows: List[QuestionRow] = []
 
-    for idx, (qid, chunk) in enumerate(chunks, start=1):
-        if max_rows_per_sheet is not None and idx > max_rows_per_sheet:
-            break
-        lines = [l.strip() for l in chunk.splitlines() if l.strip()]
-        if not lines:
-            qtext = ""
-            answer = ""
-        elif len(lines) == 1:
-            qtext = ""
-            answer = lines[0]
-        else:
-            qtext = lines[0]
-            answer = lines[-1]
-
-        rows.append(
-            QuestionRow(
-                sheet="PDF",
-                row_idx=idx,
-                question_id=qid,
-                question_text=qtext,
-                answer_text=answer,
-                expected_text="",
+    with fitz.open(filled_path) as doc:
+        pages = (page.get_text("text") for page in doc)
+        for idx, (qid, chunk) in enumerate(_iter_qid_chunks(pages), start=1):
+            if max_rows_per_sheet is not None and idx > max_rows_per_sheet:
+                break
+            qtext, answer = _question_and_answer(chunk)
+
+            rows.append(
+                QuestionRow(
+                    sheet="PDF",
+                    row_idx=idx,
+                    question_id=qid,
+                    question_text=qtext,
+                    answer_text=answer,
+                    expected_text="",
+                )
             )
-        )
 
     return rows
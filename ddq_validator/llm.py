@@ -1,13 +1,26 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import dbm
+import hashlib
+import logging
 import os
-from typing import List
+import shelve
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 
 from .models import Finding
 
+logger = logging.getLogger(__name__)
+
 
 SYSTEM_PROMPT = (
     "You are an internal due-diligence questionnaire (DDQ) validator. "
@@ -15,59 +28,315 @@ SYSTEM_PROMPT = (
     "Return ONLY valid JSON matching the requested schema."
 )
 
+# Findings marshalled into one prompt, and prompts in flight at once.
+BATCH_ROWS = 8
+MAX_CONCURRENCY = 8
+
+# Batch API polling (seconds); the completion window is provider-side.
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 120.0
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Persistent refinement cache, keyed by the SHA-256 of the per-item prompt.
+# Set DDQ_LLM_CACHE to an empty string to disable it.
+_CACHE_LOCK = threading.Lock()
+_cache: Optional[shelve.Shelf] = None
+_cache_opened = False
+
+
+def _needs_refinement(f: Finding) -> bool:
+    return not (f.status == "NEEDS_EVIDENCE" or (f.details or {}).get("reference_detected"))
+
+
+def _item_prompt(f: Finding) -> Dict[str, Any]:
+    return {
+        "question": f.question_text,
+        "customer_answer": f.answer_text,
+        "expected": f.expected_text,
+        "current_status": f.status,
+        "current_reason": f.reason,
+        "task": "Refine the assessment and suggest what exactly the customer must add/fix.",
+        "output_schema": {
+            "status": "OK | INCOMPLETE | REJECTED | NEEDS_EVIDENCE",
+            "reason": "short explanation",
+            "missing_points": ["..."],
+            "customer_request": "one short instruction to the customer"
+        }
+    }
+
+
+def _cache_key(f: Finding, model: str) -> str:
+    prompt = _item_prompt(f) | {"model": model}
+    canonical = orjson.dumps(prompt, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def _open_cache() -> Optional[shelve.Shelf]:
+    global _cache, _cache_opened
+    with _CACHE_LOCK:
+        if not _cache_opened:
+            _cache_opened = True
+            path = os.environ.get("DDQ_LLM_CACHE", ".ddq_llm_cache")
+            if path:
+                try:
+                    _cache = shelve.open(path)
+                except (OSError, dbm.error) as exc:
+                    # Read-only directory, or the dbm lock is held by another process
+                    # (e.g. the API server). The cache is optional, so run without it.
+                    logger.warning("LLM cache %r unavailable, continuing without it: %s", path, exc)
+                else:
+                    atexit.register(_cache.close)
+    return _cache
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    cache = _open_cache()
+    if cache is None:
+        return None
+    with _CACHE_LOCK:
+        return cache.get(key)
+
+
+def _cache_put(key: str, data: Dict[str, Any]) -> None:
+    cache = _open_cache()
+    if cache is None:
+        return
+    with _CACHE_LOCK:
+        cache[key] = data
+
+
+def _batch_prompt(batch: List[Finding]) -> Dict[str, Any]:
+    return {
+        "items": [
+            {
+                "idx": i,
+                "question": f.question_text,
+                "answer": f.answer_text,
+                "expected": f.expected_text,
+                "current_status": f.status,
+                "current_reason": f.reason,
+            }
+            for i, f in enumerate(batch)
+        ],
+        "task": (
+            "For every item, refine the assessment and suggest what exactly the customer must add/fix. "
+            "Return one result per item, keyed by its idx."
+        ),
+        "output_schema": {
+            "results": [
+                {
+                    "idx": "item idx",
+                    "status": "OK | INCOMPLETE | REJECTED | NEEDS_EVIDENCE",
+                    "reason": "short explanation",
+                    "missing_points": ["..."],
+                    "customer_request": "one short instruction to the customer",
+                }
+            ]
+        },
+    }
+
+
+def _apply_result(f: Finding, data: Dict[str, Any], model: str) -> None:
+    f.status = data.get("status", f.status)
+    f.reason = data.get("reason", f.reason)
+    f.details = (f.details or {}) | {
+        "missing_points": data.get("missing_points", []),
+        "customer_request": data.get("customer_request", ""),
+        "llm": True,
+        "llm_model": model,
+    }
+
+
+def _apply_raw(f: Finding, content: str, model: str) -> None:
+    # If the model responds with non-JSON, keep deterministic result and store raw output
+    f.details = (f.details or {}) | {"llm_raw": content, "llm": True, "llm_model": model}
+
+
+def _apply_error(f: Finding, error: str, model: str) -> None:
+    # Keep the deterministic result; the batch reply is not attributable to this item
+    f.details = (f.details or {}) | {"llm_error": error, "llm": True, "llm_model": model}
+
+
+def _apply_batch(batch: List[Finding], keys: List[str], content: str, model: str) -> None:
+    try:
+        data = orjson.loads(content)
+        results = data.get("results", []) if isinstance(data, dict) else data
+        by_idx = {int(r["idx"]): r for r in results}
+    except Exception:
+        for f in batch:
+            _apply_error(f, "unparseable batch reply", model)
+        return
+
+    for i, (f, key) in enumerate(zip(batch, keys)):
+        data = by_idx.get(i)
+        if isinstance(data, dict):
+            _apply_result(f, data, model)
+            _cache_put(key, data)
+        else:
+            _apply_error(f, "missing from batch reply", model)
+
+
+def _run_sync(coro) -> None:
+    """Run `coro` to completion, also when called from inside a running event loop."""
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coro)
+        return
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        ex.submit(asyncio.run, coro).result()
+
 
 def llm_refine_findings(findings: List[Finding], model: str = "gpt-5.2", max_items: int = 30) -> List[Finding]:
     """Refine flagged items with an LLM (gated; do NOT call for all rows).
 
     - Only runs if OPENAI_API_KEY is set.
     - Only processes up to `max_items` findings to keep costs controlled.
+    - Findings are sent `BATCH_ROWS` per prompt, with up to `MAX_CONCURRENCY` prompts in flight.
+    - Items refined in an earlier run are served from the local cache without a network call.
     """
 
     if not os.environ.get("OPENAI_API_KEY"):
         return findings
 
-    client = OpenAI()
-
+    pending: List[tuple[Finding, str]] = []
     for f in findings[:max_items]:
-        if f.status == "NEEDS_EVIDENCE" or (f.details or {}).get("reference_detected"):
+        if not _needs_refinement(f):
             continue
-        prompt = {
-            "question": f.question_text,
-            "customer_answer": f.answer_text,
-            "expected": f.expected_text,
-            "current_status": f.status,
-            "current_reason": f.reason,
-            "task": "Refine the assessment and suggest what exactly the customer must add/fix.",
-            "output_schema": {
-                "status": "OK | INCOMPLETE | REJECTED | NEEDS_EVIDENCE",
-                "reason": "short explanation",
-                "missing_points": ["..."],
-                "customer_request": "one short instruction to the customer"
-            }
-        }
+        key = _cache_key(f, model)
+        data = _cache_get(key)
+        if data is not None:
+            _apply_result(f, data, model)
+        else:
+            pending.append((f, key))
+    if not pending:
+        return findings
+    batches = [pending[i:i + BATCH_ROWS] for i in range(0, len(pending), BATCH_ROWS)]
 
-        resp = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": json.dumps(prompt, ensure_ascii=False)},
-            ],
-            temperature=0,
-        )
-
-        content = (resp.choices[0].message.content or "").strip()
-        try:
-            data = json.loads(content)
-            f.status = data.get("status", f.status)
-            f.reason = data.get("reason", f.reason)
-            f.details = (f.details or {}) | {
-                "missing_points": data.get("missing_points", []),
-                "customer_request": data.get("customer_request", ""),
-                "llm": True,
-                "llm_model": model,
-            }
-        except Exception:
-            # If the model responds with non-JSON, keep deterministic result and store raw output
-            f.details = (f.details or {}) | {"llm_raw": content, "llm": True, "llm_model": model}
+    async def _run() -> None:
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        async with AsyncOpenAI() as client:
+
+            async def _refine(items: List[tuple[Finding, str]]) -> None:
+                batch = [f for f, _ in items]
+                async with sem:
+                    resp = await client.chat.completions.create(
+                        model=model,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": orjson.dumps(_batch_prompt(batch)).decode()},
+                        ],
+                        temperature=0,
+                    )
+                content = (resp.choices[0].message.content or "").strip()
+                _apply_batch(batch, [key for _, key in items], content, model)
+
+            await asyncio.gather(*(_refine(b) for b in batches))
+
+    _run_sync(_run())
+    return findings
+
+
+def llm_refine_findings_batch(
+    findings: List[Finding],
+    model: str = "gpt-5.2",
+    max_wait: Optional[float] = None,
+) -> List[Finding]:
+    """Refine flagged items through the OpenAI Batch API.
+
+    Meant for bulk/offline runs: every eligible finding is submitted (no `max_items` cap)
+    at roughly half the token cost, but results take minutes rather than seconds.
+    If the batch does not complete, or is not done within `max_wait` seconds (None waits for
+    the provider's completion window), it is cancelled and the deterministic results are kept.
+    """
+
+    if not os.environ.get("OPENAI_API_KEY"):
+        return findings
+
+    by_custom_id: Dict[str, tuple[Finding, str]] = {}
+    for f in findings:
+        if not _needs_refinement(f):
+            continue
+        key = _cache_key(f, model)
+        data = _cache_get(key)
+        if data is not None:
+            _apply_result(f, data, model)
+        else:
+            by_custom_id[f"{f.sheet}|{f.row_idx}|{f.question_id}"] = (f, key)
+    if not by_custom_id:
+        return findings
+
+    client = OpenAI()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        requests_path = Path(tmp_dir) / "requests.jsonl"
+        with requests_path.open("wb") as out:
+            for custom_id, (f, _) in by_custom_id.items():
+                line = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [
+                            {"role": "system", "content": SYSTEM_PROMPT},
+                            {"role": "user", "content": orjson.dumps(_item_prompt(f)).decode()},
+                        ],
+                        "temperature": 0,
+                    },
+                }
+                out.write(orjson.dumps(line) + b"\n")
+
+        with requests_path.open("rb") as fh:
+            input_file = client.files.create(file=fh, purpose="batch")
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+
+    deadline = None if max_wait is None else time.monotonic() + max_wait
+    delay = BATCH_POLL_INITIAL
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                try:
+                    # Nobody will read the output any more; don't pay for it.
+                    client.batches.cancel(batch.id)
+                except OpenAIError:
+                    pass
+                return findings
+            delay = min(delay, remaining)
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        return findings
+
+    with client.files.with_streaming_response.content(batch.output_file_id) as resp:
+        for raw in resp.iter_lines():
+            if not raw.strip():
+                continue
+            line = orjson.loads(raw)
+            item = by_custom_id.get(line.get("custom_id"))
+            if item is None:
+                continue
+            f, key = item
+            try:
+                body = line["response"]["body"]
+                content = (body["choices"][0]["message"]["content"] or "").strip()
+            except (KeyError, IndexError, TypeError):
+                continue
+            try:
+                data = orjson.loads(content)
+                _apply_result(f, data, model)
+            except Exception:
+                _apply_raw(f, content, model)
+            else:
+                _cache_put(key, data)
 
     return findings
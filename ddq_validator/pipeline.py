@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .extract import load_questions, load_questions_pdf
+from .llm import llm_refine_findings, llm_refine_findings_batch
+from .redact import redact_rows
+from .report import write_report
+from .rules import RuleConfig, validate_rows
+
+
+# Built once per process; validation only reads it.
+_DEFAULT_CFG = RuleConfig.default()
+
+
+REDACT_REQUIRED_FOR_LLM = "Name redaction cannot be turned off when LLM refinement is enabled."
+
+
+class NoRowsExtractedError(RuntimeError):
+    """The filled file yielded no question rows (usually an unexpected column layout)."""
+
+
+def run_validation(
+    filled: Path,
+    out_dir: Optional[Path],
+    use_llm: bool = False,
+    llm_model: str = "gpt-5.2",
+    max_rows: Optional[int] = None,
+    *,
+    use_batch_api: bool = False,
+    batch_max_wait: Optional[float] = None,
+    redact: bool = True,
+) -> Dict[str, Any]:
+    """Extract, redact, validate and report one filled DDQ file.
+
+    `redact=False` skips name redaction; only use it when the report stays internal. It is
+    rejected with `use_llm`, so unredacted names are never sent to the LLM.
+
+    Returns the `write_report` result (output paths + summary) plus the findings under
+    `results`. With `out_dir=None` nothing is written to disk and the report contents are
+    returned instead of paths. `batch_max_wait` bounds how long the Batch API path waits
+    for results (seconds; None waits for the whole completion window).
+    """
+
+    if use_llm and not redact:
+        raise ValueError(REDACT_REQUIRED_FOR_LLM)
+
+    filled = Path(filled)
+    if filled.suffix.lower() == ".pdf":
+        rows = load_questions_pdf(
+            filled_path=str(filled),
+            max_rows_per_sheet=max_rows,
+        )
+    else:
+        rows = load_questions(
+            filled_path=str(filled),
+            max_rows_per_sheet=max_rows,
+        )
+    if redact:
+        rows = redact_rows(rows)
+    if not rows:
+        raise NoRowsExtractedError(
+            "No rows were extracted. Check that the filled file uses the expected "
+            "column layout (A=ID, B=Question, C=Answer)."
+        )
+
+    results = validate_rows(rows, _DEFAULT_CFG)
+    findings = [r for r in results if r.status not in {"OK", "SKIPPED"}]
+
+    if use_llm and findings:
+        if use_batch_api:
+            refined = llm_refine_findings_batch(findings, model=llm_model, max_wait=batch_max_wait)
+        else:
+            refined = llm_refine_findings(findings, model=llm_model)
+        refined_map = {(f.sheet, f.row_idx, f.question_id): f for f in refined}
+        results = [
+            refined_map.get((r.sheet, r.row_idx, r.question_id), r)
+            for r in results
+        ]
+
+    report = write_report(results, None if out_dir is None else str(out_dir))
+    report["results"] = results
+    return report
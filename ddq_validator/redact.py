@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import re
+from dataclasses import replace
 from typing import Iterable, List
 
 from .models import QuestionRow
 
 
+# Labelled, titled and "by/from" names, applied as separate passes in this order. They are not
+# merged into one alternation: there the leftmost match wins, so a by/from match would swallow a
+# later "Dr." and stop at its dot, leaving the surname after it unredacted.
+# They are compiled with the stdlib re on purpose: RE2's \s and \b are ASCII-only, so names after
+# a non-breaking space (common in Excel and Word text) would not be redacted.
 _NAME_LABEL_RE = re.compile(
     r"(?i)\b(name|contact|prepared by|author|signed by|signatory|respondent)\b\s*[:\-]\s*"
     r"([A-Z][a-z]+(?:[\s\-'\.][A-Z][a-z]+){0,3})"
@@ -22,13 +28,21 @@ _GENERAL_NAME_RE = re.compile(
 )
 
 
+def _label_redacted(m: re.Match) -> str:
+    return f"{m.group(1)}: [REDACTED]"
+
+
+def _keyword_redacted(m: re.Match) -> str:
+    return f"{m.group(1)} [REDACTED]"
+
+
 def redact_names(text: str) -> str:
     if not text:
         return text
 
-    text = _NAME_LABEL_RE.sub(lambda m: f"{m.group(1)}: [REDACTED]", text)
-    text = _TITLE_RE.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
-    text = _BY_FROM_RE.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
+    text = _NAME_LABEL_RE.sub(_label_redacted, text)
+    text = _TITLE_RE.sub(_keyword_redacted, text)
+    text = _BY_FROM_RE.sub(_keyword_redacted, text)
     text = _GENERAL_NAME_RE.sub("[REDACTED]", text)
     return text
 
@@ -36,14 +50,23 @@ def redact_names(text: str) -> str:
 def redact_rows(rows: Iterable[QuestionRow]) -> List[QuestionRow]:
     redacted: List[QuestionRow] = []
     for row in rows:
+        question_text = redact_names(row.question_text)
+        answer_text = redact_names(row.answer_text)
+        expected_text = redact_names(row.expected_text)
+        if (
+            question_text == row.question_text
+            and answer_text == row.answer_text
+            and expected_text == row.expected_text
+        ):
+            # Nothing redacted: keep the original object instead of copying it.
+            redacted.append(row)
+            continue
         redacted.append(
-            QuestionRow(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=redact_names(row.question_text),
-                answer_text=redact_names(row.answer_text),
-                expected_text=redact_names(row.expected_text),
+            replace(
+                row,
+                question_text=question_text,
+                answer_text=answer_text,
+                expected_text=expected_text,
             )
         )
     return redacted
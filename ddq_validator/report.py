@@ -1,52 +1,114 @@
 from __future__ import annotations
 
 import csv
-import json
+import io
 from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, TextIO
+
+import orjson
 
 from .models import Finding
 
 
-def write_report(results: List[Finding], out_dir: str) -> Dict[str, Any]:
-    out = Path(out_dir)
-    out.mkdir(parents=True, exist_ok=True)
-
-    report_path = out / "report.csv"
-    summary_path = out / "summary.json"
-
-    # Flatten data for CSV
-    fieldnames = [
-        "sheet",
-        "row_idx",
-        "question_id",
-        "question_text",
-        "answer_text",
-        "expected_text",
-        "status",
-        "reason",
-        "details_json",
-    ]
-
-    with report_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for item in results:
-            d = item.to_dict()
-            d["details_json"] = json.dumps(d.get("details", {}), ensure_ascii=False)
-            w.writerow({k: d.get(k, "") for k in fieldnames})
-
-    counts = Counter([f.status for f in results])
-    flagged_statuses = {k for k in counts.keys() if k not in {"OK", "SKIPPED"}}
-    total_flagged = sum(v for k, v in counts.items() if k in flagged_statuses)
+# Flatten data for CSV
+FIELDNAMES = [
+    "sheet",
+    "row_idx",
+    "question_id",
+    "question_text",
+    "answer_text",
+    "expected_text",
+    "status",
+    "reason",
+    "details_json",
+]
+
+
+UNFLAGGED_STATUSES = frozenset({"OK", "SKIPPED"})
+
+# Rows formatted per write; bounds the staging buffer on very large reports.
+REPORT_WRITE_BATCH = 10_000
+
+
+def _details_json(details: Optional[Dict[str, Any]]) -> str:
+    # details come from the rules or from orjson.loads of LLM output, so orjson can always
+    # encode them; api.py serializes the same dicts with orjson too.
+    return orjson.dumps(details or {}).decode("utf-8")
+
+
+def _row_iter(results: List[Finding], counts: Counter) -> Iterator[tuple]:
+    for item in results:
+        counts[item.status] += 1
+        yield (
+            item.sheet,
+            item.row_idx,
+            item.question_id or "",
+            item.question_text,
+            item.answer_text,
+            item.expected_text,
+            item.status,
+            item.reason,
+            _details_json(item.details),
+        )
+
+
+def _write_csv(f: TextIO, results: List[Finding]) -> Counter:
+    """Write the report rows to `f` and return the status counts.
+
+    Rows are formatted into an in-memory buffer and handed to `f` in one write per
+    `REPORT_WRITE_BATCH` rows instead of one small write per row.
+    """
+
+    counts: Counter = Counter()
+    buf = io.StringIO(newline="")
+    w = csv.writer(buf)
+    w.writerow(FIELDNAMES)
+    for start in range(0, max(len(results), 1), REPORT_WRITE_BATCH):
+        w.writerows(_row_iter(results[start:start + REPORT_WRITE_BATCH], counts))
+        f.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate()
+    return counts
+
+
+def write_report(results: List[Finding], out_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Write report.csv and summary.json to `out_dir`.
+
+    With `out_dir=None` nothing is written to disk; `report_csv` and `summary_json`
+    then hold the file contents instead of their paths.
+    """
+
+    if out_dir is None:
+        # newline=None gives "\n" line endings, the same text as reading the file back
+        buf = io.StringIO(newline=None)
+        counts = _write_csv(buf, results)
+    else:
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+
+        report_path = out / "report.csv"
+        summary_path = out / "summary.json"
+
+        with report_path.open("w", newline="", encoding="utf-8") as f:
+            counts = _write_csv(f, results)
+
+    total_flagged = sum(v for k, v in counts.items() if k not in UNFLAGGED_STATUSES)
     summary = {
         "total_rows": len(results),
         "total_flagged": total_flagged,
         "by_status": dict(counts),
     }
+    summary_bytes = orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+
+    if out_dir is None:
+        return {
+            "report_csv": buf.getvalue(),
+            "summary_json": summary_bytes.decode(),
+            "summary": summary,
+        }
 
-    summary_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+    summary_path.write_bytes(summary_bytes)
 
     return {
         "report_csv": str(report_path),
@@ -1,68 +1,102 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import List, Optional
+import string
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence
 
 from .models import QuestionRow, Finding
 
 
 YES_PAT = re.compile(r"\b(ja|yes|y|bestätigt|confirmed)\b", re.I)
 NO_PAT = re.compile(r"\b(nein|no|n)\b", re.I)
-EMAIL_PAT = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
-PHONE_PAT = re.compile(r"[0-9].*[0-9].*[0-9].*[0-9].*[0-9].*[0-9].*[0-9]")
-URL_PAT = re.compile(r"(https?://|www\.)\S+", re.I)
+EMAIL_PAT = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")  # used with fullmatch
 FILENAME_PAT = re.compile(r"\b[\w\-.]+\.(pdf|docx|doc|xlsx|xls|pptx|ppt|zip|png|jpg|jpeg|csv)\b", re.I)
-REFUSAL_PAT = re.compile(r"\b(refusal|refuse|decline|not to answer|no answer)\b", re.I)
+# The keyword patterns below are matched against lowercased text and compiled without re.I:
+# a case-sensitive alternation gets a literal-prefix fast path that re.I disables, which makes
+# the per-row probes several times faster. Pass `.lower()`-ed text to them.
+REFUSAL_PAT = re.compile(r"\b(refusal|refuse|decline|not to answer|no answer)\b")
 SIGNATURE_PAT = re.compile(
     r"(signature|signatur|unterschrift|name\s*&\s*position|name\s*and\s*position|"
-    r"ort\s*/\s*datum|place\s*/\s*date)",
-    re.I,
+    r"ort\s*/\s*datum|place\s*/\s*date)"
 )
+QUESTION_VERB_PAT = re.compile(r"\b(beschreiben|erläutern|bestätigen|informieren|detaillieren|teilen)\b")
+DESCRIBE_PAT = re.compile(r"\b(beschreiben|erläutern|detaillieren)\b")
 REFERENCE_PAT = re.compile(
     r"(see|refer|reference|attached|attachment|annex|section|chapter|appendix|"
     r"siehe|vgl\.|verweis|anhang|beigefügt|abschnitt|kapitel|ziffer)"
-    r"|\b\d+(?:\.\d+){1,}\b",  # e.g. 4.1.9
-    re.I,
+    r"|\b\d+(?:\.\d+){1,}\b"  # e.g. 4.1.9
 )
+URL_PAT = re.compile(r"(https?://|www\.)\S+")
+
+
+# Most DDQ questions start with these verbs
+QUESTION_STARTERS = ("bitte", "please", "sofern", "gab", "wurde", "hat", "ist", "nutzen", "wird")
+NOTE_STARTERS = (
+    "please note",
+    "bitte beachten",
+    "hinweis",
+    "note:",
+    "the following documents",
+)
+# Section headings whose expected text is often only a note
+NOTE_HEADINGS = frozenset({"prozesse", "dokumentation", "outsourcing"})
+NOTE_MARKERS = ("please note", "bitte", "note")
+# Contact / identification-like fields in this DDQ are typically mandatory
+MANDATORY_Q_PREFIXES = ("name der", "e-mail", "telefon")
 
 
 @dataclass
 class RuleConfig:
-    forbidden_tokens: List[str]
+    # Lowercased on construction; answers are lowercased before matching.
+    forbidden_tokens: FrozenSet[str]
     min_len_descriptive: int = 20
+    # One alternation over all tokens, so an answer is scanned once instead of once per token.
+    _forbidden_re: re.Pattern = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.forbidden_tokens = frozenset(t.lower() for t in self.forbidden_tokens)
+        # Longest first, so "not applicable" wins over a shorter token at the same position.
+        tokens = sorted(self.forbidden_tokens, key=lambda t: (-len(t), t))
+        self._forbidden_re = re.compile("|".join(map(re.escape, tokens)) or "(?!)")
 
     @staticmethod
     def default() -> "RuleConfig":
         return RuleConfig(
-            forbidden_tokens=[
-                "n/a",
-                "n.a",
-                "na",
-                "not applicable",
-                "tbd",
-                "to be defined",
-                "later",
-                "unknown",
-                "k.a",
-                "keine angabe",
-            ],
+            forbidden_tokens=frozenset(
+                {
+                    "n/a",
+                    "n.a",
+                    "na",
+                    "not applicable",
+                    "tbd",
+                    "to be defined",
+                    "later",
+                    "unknown",
+                    "k.a",
+                    "keine angabe",
+                }
+            ),
             min_len_descriptive=20,
         )
 
 
 def looks_like_question(text: str) -> bool:
-    t = (text or "").strip()
+    return _is_question((text or "").strip().lower())
+
+
+def _is_question(t: str) -> bool:
+    """`looks_like_question` for text that is already stripped and lowercased."""
+
     if not t:
         return False
-    # Most DDQ questions start with these verbs
-    starters = ("bitte", "please", "sofern", "gab", "wurde", "hat", "ist", "nutzen", "wird")
-    if t.lower().startswith(starters):
+    if t.startswith(QUESTION_STARTERS):
         return True
     if "?" in t:
         return True
     # Many questions contain these verbs
-    if re.search(r"\b(beschreiben|erläutern|bestätigen|informieren|detaillieren|teilen)\b", t, re.I):
+    if QUESTION_VERB_PAT.search(t):
         return True
     return False
 
@@ -70,22 +104,19 @@ def looks_like_question(text: str) -> bool:
 def looks_like_note(expected: str, question_text: str) -> bool:
     """Heuristic to ignore guidance lines that are not meant to be answered."""
 
-    e = (expected or "").strip().lower()
-    q = (question_text or "").strip().lower()
+    return _is_note((expected or "").strip().lower(), (question_text or "").strip().lower())
+
+
+def _is_note(e: str, q: str) -> bool:
+    """`looks_like_note` for texts that are already stripped and lowercased."""
+
     if not e:
         return False
 
-    note_starters = (
-        "please note",
-        "bitte beachten",
-        "hinweis",
-        "note:",
-        "the following documents",
-    )
-    if e.startswith(note_starters):
+    if e.startswith(NOTE_STARTERS):
         return True
     # Many sheets have a section heading like "Prozesse" and the expected text is only a note.
-    if q in {"prozesse", "dokumentation", "outsourcing"} and any(s in e for s in ["please note", "bitte", "note"]):
+    if q in NOTE_HEADINGS and any(s in e for s in NOTE_MARKERS):
         return True
     return False
 
@@ -96,464 +127,464 @@ def is_signature_row(row: QuestionRow) -> bool:
     return bool(SIGNATURE_PAT.search(q) or SIGNATURE_PAT.search(e))
 
 
-def is_allgemeiner_sheet(sheet: str) -> bool:
+# Sheet kinds returned by classify_sheet (a name can match several, e.g. "ZV FoBu Fondsmanagement").
+SHEET_ALLGEMEIN = 1 << 0
+SHEET_FONDS = 1 << 1
+SHEET_INNENREVISION = 1 << 2
+SHEET_REGTA = 1 << 3
+SHEET_ZV_FOBU = 1 << 4
+SHEET_VERWAHRSTELLE = 1 << 5
+
+
+@lru_cache(maxsize=64)
+def classify_sheet(sheet: str) -> int:
+    """Bitmask of SHEET_* kinds for a sheet name; cached since every row of a sheet asks again."""
+
     s = (sheet or "").lower()
-    return "allgemein" in s or "general" in s
+    kind = 0
+    if "allgemein" in s or "general" in s:
+        kind |= SHEET_ALLGEMEIN
+    if "fondsmanagement" in s or "fund management" in s:
+        kind |= SHEET_FONDS
+    if "innenrevision" in s:
+        kind |= SHEET_INNENREVISION
+    if "regta" in s:
+        kind |= SHEET_REGTA
+    if "zv" in s and "fobu" in s:
+        kind |= SHEET_ZV_FOBU
+    if "verwahrstelle" in s:
+        kind |= SHEET_VERWAHRSTELLE
+    return kind
+
+
+def is_allgemeiner_sheet(sheet: str) -> bool:
+    return bool(classify_sheet(sheet) & SHEET_ALLGEMEIN)
 
 
 def is_fondsmanagement_sheet(sheet: str) -> bool:
-    s = (sheet or "").lower()
-    return "fondsmanagement" in s or "fund management" in s
+    return bool(classify_sheet(sheet) & SHEET_FONDS)
 
 
 def is_innenrevision_sheet(sheet: str) -> bool:
-    s = (sheet or "").lower()
-    return "innenrevision" in s
+    return bool(classify_sheet(sheet) & SHEET_INNENREVISION)
 
 
 def is_regta_sheet(sheet: str) -> bool:
-    s = (sheet or "").lower()
-    return "regta" in s
+    return bool(classify_sheet(sheet) & SHEET_REGTA)
 
 
 def is_zv_fobu_sheet(sheet: str) -> bool:
-    s = (sheet or "").lower()
-    return "zv" in s and "fobu" in s
+    return bool(classify_sheet(sheet) & SHEET_ZV_FOBU)
 
 
 def is_verwahrstelle_sheet(sheet: str) -> bool:
-    s = (sheet or "").lower()
-    return "verwahrstelle" in s
+    return bool(classify_sheet(sheet) & SHEET_VERWAHRSTELLE)
+
+
+# Model-answer traits returned by classify_expected.
+EXP_FILENAME = 1 << 0
+EXP_NUMBER_AND_TEXT = 1 << 1
+EXP_CONTENT_NOT_RELEVANT = 1 << 2
+EXP_NO_REFERENCE = 1 << 3
+EXP_NO_REFUSAL = 1 << 4
+EXP_MANDATORY = 1 << 5
+EXP_TEXT = 1 << 6
+EXP_YES = 1 << 7
+EXP_NO = 1 << 8
+_EXP_NOT_ACCEPTABLE = 1 << 9
+_EXP_NA = 1 << 10
+_EXP_JA = 1 << 11
+_EXP_NEIN = 1 << 12
+
+_EXPECTED_PHRASES = (
+    ("name of a file", EXP_FILENAME),
+    ("name of file", EXP_FILENAME),
+    ("dateiname", EXP_FILENAME),
+    ("number and text obligatory", EXP_NUMBER_AND_TEXT),
+    ("nummer und text", EXP_NUMBER_AND_TEXT),
+    ("content not relevant", EXP_CONTENT_NOT_RELEVANT),
+    ("fields must only be filled", EXP_CONTENT_NOT_RELEVANT),
+    ("reference to a document is not acceptable", EXP_NO_REFERENCE),
+    ("reference to another document is not acceptable", EXP_NO_REFERENCE),
+    ("only reference to another document is also not acceptable", EXP_NO_REFERENCE),
+    ("refusal is not acceptable", EXP_NO_REFUSAL),  # also "any sort of refusal is not acceptable"
+    ("not acceptable", _EXP_NOT_ACCEPTABLE | EXP_MANDATORY),
+    ("obligatory", EXP_MANDATORY),
+    ("must", EXP_MANDATORY),
+    ("n/a", _EXP_NA),
+    ("[text]", EXP_TEXT),
+    ("ja", _EXP_JA),
+    ("nein", _EXP_NEIN),
+)
 
 
-def expected_requires_filename(expected: str) -> bool:
+@lru_cache(maxsize=1024)
+def classify_expected(expected: str) -> int:
+    """Bitmask of EXP_* traits of a model answer, from a single lowercased copy.
+
+    Cached since the reference workbook repeats the same model answers across many rows.
+    """
+
     e = (expected or "").lower()
-    return any(k in e for k in ["name of a file", "name of file", "dateiname"])
+    flags = 0
+    for phrase, flag in _EXPECTED_PHRASES:
+        if phrase in e:
+            flags |= flag
+
+    if flags & _EXP_NOT_ACCEPTABLE and flags & _EXP_NA:
+        flags |= EXP_NO_REFUSAL
+    # Typical model answers in your file: "Ja" / "Nein" or "JA; Bestätigt..."
+    yes_no = flags & (_EXP_JA | _EXP_NEIN)
+    if yes_no == _EXP_JA:
+        flags |= EXP_YES
+    elif yes_no == _EXP_NEIN:
+        flags |= EXP_NO
+    return flags
+
+
+def expected_requires_filename(expected: str) -> bool:
+    return bool(classify_expected(expected) & EXP_FILENAME)
 
 
 def expected_requires_number_and_text(expected: str) -> bool:
-    e = (expected or "").lower()
-    return "number and text obligatory" in e or "nummer und text" in e
+    return bool(classify_expected(expected) & EXP_NUMBER_AND_TEXT)
 
 
 def expected_content_not_relevant(expected: str) -> bool:
-    e = (expected or "").lower()
-    return "content not relevant" in e or "fields must only be filled" in e
+    return bool(classify_expected(expected) & EXP_CONTENT_NOT_RELEVANT)
 
 
 def expected_disallow_reference(expected: str) -> bool:
-    e = (expected or "").lower()
-    return (
-        "reference to a document is not acceptable" in e
-        or "reference to another document is not acceptable" in e
-        or "only reference to another document is also not acceptable" in e
-    )
+    return bool(classify_expected(expected) & EXP_NO_REFERENCE)
 
 
 def expected_disallow_refusal(expected: str) -> bool:
-    e = (expected or "").lower()
-    return (
-        "refusal is not acceptable" in e
-        or "any sort of refusal is not acceptable" in e
-        or ("not acceptable" in e and "n/a" in e)
-    )
+    return bool(classify_expected(expected) & EXP_NO_REFUSAL)
 
 
 def looks_like_email(answer: str) -> bool:
-    return bool(EMAIL_PAT.match((answer or "").strip()))
+    return bool(EMAIL_PAT.fullmatch((answer or "").strip()))
+
+
+_PHONE_MIN_DIGITS = 7
 
 
 def looks_like_phone(answer: str) -> bool:
-    return bool(PHONE_PAT.search(answer or ""))
+    # At least 7 ASCII digits on one line. Counted directly instead of with a chain of `.*`
+    # groups, which backtracks heavily on long answers with few digits.
+    return any(
+        sum(map(line.count, "0123456789")) >= _PHONE_MIN_DIGITS for line in (answer or "").split("\n")
+    )
 
 
 def looks_like_url(answer: str) -> bool:
     a = (answer or "").strip()
-    return bool(URL_PAT.search(a)) or ("." in a and " " not in a and len(a) >= 4)
+    return bool(URL_PAT.search(a.lower())) or ("." in a and " " not in a and len(a) >= 4)
 
 
 def looks_like_filename(answer: str) -> bool:
     return bool(FILENAME_PAT.search(answer or ""))
 
 
+_DIGITS = frozenset("0123456789")
+_LETTERS = frozenset(string.ascii_letters + "ÄÖÜäöü")
+
+
 def has_number_and_text(answer: str) -> bool:
-    a = (answer or "").strip()
-    return bool(re.search(r"[0-9]", a)) and bool(re.search(r"[A-Za-zÄÖÜäöü]", a))
+    # Set membership runs in C and stops at the first hit; no regex engine, no strip() copy.
+    a = answer or ""
+    return not _DIGITS.isdisjoint(a) and not _LETTERS.isdisjoint(a)
+
+
+@dataclass
+class _RowContext:
+    """Normalised texts and traits of one row, derived once and shared by the gate and the rules."""
+
+    answer: str  # stripped
+    a_lower: str
+    q_lower: str
+    e_lower: str  # stripped
+    sheet_kind: int
+    eflags: int
+    signature: bool
+    mandatory: bool
+
+
+def _row_context(row: QuestionRow) -> _RowContext:
+    answer = (row.answer_text or "").strip()
+    expected = row.expected_text or ""
+    q_lower = (row.question_text or "").lower()
+    e_lower = expected.strip().lower()
+    return _RowContext(
+        answer=answer,
+        a_lower=answer.lower(),
+        q_lower=q_lower,
+        e_lower=e_lower,
+        sheet_kind=classify_sheet(row.sheet),
+        eflags=classify_expected(expected),
+        signature=bool(SIGNATURE_PAT.search(q_lower) or SIGNATURE_PAT.search(e_lower)),
+        mandatory=_is_mandatory(e_lower, q_lower),
+    )
 
 
 def should_validate(row: QuestionRow) -> bool:
     """Decide whether a row is intended to be answered."""
 
-    expected = (row.expected_text or "")
-    if looks_like_note(expected, row.question_text):
+    return _should_validate(_row_context(row))
+
+
+def _should_validate(ctx: _RowContext) -> bool:
+    q = ctx.q_lower.strip()
+    if _is_note(ctx.e_lower, q):
         return False
 
-    if is_signature_row(row):
+    if ctx.signature:
         return True
 
     # Validate if it looks like an actual question
-    if looks_like_question(row.question_text):
+    if _is_question(q):
         return True
 
     # Or if the reference workbook explicitly defines expected behavior
-    e_lower = expected.lower()
-    if "[text]" in e_lower:
-        return True
-    if any(k in e_lower for k in ["obligatory", "not acceptable", "must", "fields must only be filled", "number and text obligatory"]):
-        return True
-    if expected_yes_no(expected) is not None:
+    if ctx.eflags & (EXP_TEXT | EXP_MANDATORY | EXP_YES | EXP_NO):
         return True
 
     return False
 
 
 def is_mandatory(row: QuestionRow) -> bool:
-    e = (row.expected_text or "").lower()
-    q = (row.question_text or "").lower()
+    return _is_mandatory((row.expected_text or "").strip().lower(), (row.question_text or "").lower())
+
+
+def _is_mandatory(e: str, q: str) -> bool:
+    """`is_mandatory` for a stripped, lowercased expected text and a lowercased question."""
+
     if "obligatory" in e or "not acceptable" in e or "must" in e:
         return True
     # If we have any expected text at all, assume it's mandatory/checked.
-    if e.strip():
+    if e:
         return True
-    # Contact / identification-like fields in this DDQ are typically mandatory
-    if q.startswith("name der") or q.startswith("e-mail") or q.startswith("telefon"):
+    if q.startswith(MANDATORY_Q_PREFIXES):
         return True
     return False
 
 
 def detect_reference(answer: str) -> bool:
-    return bool(REFERENCE_PAT.search(answer or ""))
+    return bool(REFERENCE_PAT.search((answer or "").lower()))
 
 
 def contains_forbidden(answer: str, cfg: RuleConfig) -> Optional[str]:
-    a = (answer or "").strip().lower()
-    if not a:
-        return None
-    for tok in cfg.forbidden_tokens:
-        if tok in a:
-            return tok
-    return None
+    return _find_forbidden((answer or "").strip().lower(), cfg)
+
+
+def _find_forbidden(a: str, cfg: RuleConfig) -> Optional[str]:
+    """`contains_forbidden` for an answer that is already stripped and lowercased."""
+
+    m = cfg._forbidden_re.search(a)
+    # The token that occurs first in the answer (longest one if several start there).
+    return m.group(0) if m else None
 
 
 def expected_yes_no(expected: str) -> Optional[str]:
-    e = (expected or "").lower()
-    # Typical model answers in your file: "Ja" / "Nein" or "JA; Bestätigt..."
-    if "ja" in e and "nein" not in e:
+    flags = classify_expected(expected)
+    if flags & EXP_YES:
         return "YES"
-    if "nein" in e and "ja" not in e:
+    if flags & EXP_NO:
         return "NO"
     return None
 
 
+def _finding(row: QuestionRow, status: str, reason: str, details: Dict[str, Any]) -> Finding:
+    """Build a Finding for `row`; the six row fields are copied in one place."""
+
+    return Finding(
+        sheet=row.sheet,
+        row_idx=row.row_idx,
+        question_id=row.question_id,
+        question_text=row.question_text,
+        answer_text=row.answer_text,
+        expected_text=row.expected_text,
+        status=status,
+        reason=reason,
+        details=details,
+    )
+
+
+# Sheets whose model answers can rule out reference-only and refusal-style answers.
+_NO_REFERENCE_SHEETS = SHEET_FONDS | SHEET_REGTA | SHEET_ZV_FOBU | SHEET_VERWAHRSTELLE
+
+
+def _reference_only(row: QuestionRow) -> Finding:
+    return _finding(
+        row,
+        "REJECTED",
+        "Reference-only answers are not acceptable; provide substantive text.",
+        {"reference_only": True},
+    )
+
+
 def validate_row(row: QuestionRow, cfg: RuleConfig) -> Optional[Finding]:
     """Return a Finding for flagged rows only. OK rows return None."""
 
+    ctx = _row_context(row)
     # Skip headings/titles or pure guidance lines
-    if not should_validate(row):
+    if not _should_validate(ctx):
         return None
+    return _check_row(row, ctx, cfg)
 
-    answer = (row.answer_text or "").strip()
-    expected = (row.expected_text or "").strip()
-    mandatory = is_mandatory(row)
 
-    if is_signature_row(row):
-        forbidden = contains_forbidden(answer, cfg)
+def _check_row(row: QuestionRow, ctx: _RowContext, cfg: RuleConfig) -> Optional[Finding]:
+    """The rule cascade of `validate_row`, for a row already known to need validation."""
+
+    answer = ctx.answer
+    q_lower = ctx.q_lower
+    e_lower = ctx.e_lower
+    a_lower = ctx.a_lower
+    mandatory = ctx.mandatory
+    sheet_kind = ctx.sheet_kind
+    eflags = ctx.eflags
+
+    if ctx.signature:
+        forbidden = _find_forbidden(a_lower, cfg)
         if not answer or forbidden:
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="INCOMPLETE",
-                reason="Signature/name/date is missing.",
-                details={"expected": "signature"},
-            )
+            return _finding(row, "INCOMPLETE", "Signature/name/date is missing.", {"expected": "signature"})
         return None
 
     if not answer:
         if mandatory:
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Mandatory field is empty.",
-                details={"mandatory": True},
-            )
+            return _finding(row, "REJECTED", "Mandatory field is empty.", {"mandatory": True})
         return None
 
-    forbidden = contains_forbidden(answer, cfg)
+    forbidden = _find_forbidden(a_lower, cfg)
     if forbidden and mandatory:
-        return Finding(
-            sheet=row.sheet,
-            row_idx=row.row_idx,
-            question_id=row.question_id,
-            question_text=row.question_text,
-            answer_text=row.answer_text,
-            expected_text=row.expected_text,
-            status="REJECTED",
-            reason=f"Answer contains forbidden placeholder: '{forbidden}'.",
-            details={"forbidden": forbidden},
+        return _finding(
+            row,
+            "REJECTED",
+            f"Answer contains forbidden placeholder: '{forbidden}'.",
+            {"forbidden": forbidden},
         )
 
-    if expected_requires_filename(expected) and not looks_like_filename(answer):
-        return Finding(
-            sheet=row.sheet,
-            row_idx=row.row_idx,
-            question_id=row.question_id,
-            question_text=row.question_text,
-            answer_text=row.answer_text,
-            expected_text=row.expected_text,
-            status="INCOMPLETE",
-            reason="Expected a filename (e.g., .pdf/.docx) but none found.",
-            details={"expected": "filename"},
+    if eflags & EXP_FILENAME and not looks_like_filename(answer):
+        return _finding(
+            row,
+            "INCOMPLETE",
+            "Expected a filename (e.g., .pdf/.docx) but none found.",
+            {"expected": "filename"},
         )
 
-    if is_allgemeiner_sheet(row.sheet):
-        q_lower = (row.question_text or "").lower()
-        e_lower = expected.lower()
-
-        if expected_requires_number_and_text(expected) and not has_number_and_text(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="INCOMPLETE",
-                reason="Expected both a number and descriptive text.",
-                details={"expected": "number+text"},
+    if sheet_kind & SHEET_ALLGEMEIN:
+        if eflags & EXP_NUMBER_AND_TEXT and not has_number_and_text(answer):
+            return _finding(
+                row,
+                "INCOMPLETE",
+                "Expected both a number and descriptive text.",
+                {"expected": "number+text"},
             )
 
         if "e-mail" in q_lower or "email" in q_lower or "e-mail" in e_lower:
             if not looks_like_email(answer):
-                return Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="INCOMPLETE",
-                    reason="Expected a valid email address.",
-                    details={"expected": "email"},
-                )
+                return _finding(row, "INCOMPLETE", "Expected a valid email address.", {"expected": "email"})
 
         if "telefon" in q_lower or "phone" in q_lower or "telefon" in e_lower:
             if not looks_like_phone(answer):
-                return Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="INCOMPLETE",
-                    reason="Expected a valid phone number.",
-                    details={"expected": "phone"},
-                )
+                return _finding(row, "INCOMPLETE", "Expected a valid phone number.", {"expected": "phone"})
 
         if "website" in q_lower or "web" in q_lower:
             if not looks_like_url(answer):
-                return Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="INCOMPLETE",
-                    reason="Expected a website/URL.",
-                    details={"expected": "url"},
-                )
-
-        if expected_content_not_relevant(expected):
+                return _finding(row, "INCOMPLETE", "Expected a website/URL.", {"expected": "url"})
+
+        if eflags & EXP_CONTENT_NOT_RELEVANT:
             # For content-not-relevant fields, any non-empty answer is acceptable.
             return None
 
-    if is_fondsmanagement_sheet(row.sheet):
-        # Disallow "see attachment" style references unless it is explicitly a policy reference.
-        if expected_disallow_reference(expected):
-            if detect_reference(answer) and "policy" not in answer.lower():
-                return Finding(
-                    sheet=row.sheet,
-                    row_idx=row.row_idx,
-                    question_id=row.question_id,
-                    question_text=row.question_text,
-                    answer_text=row.answer_text,
-                    expected_text=row.expected_text,
-                    status="REJECTED",
-                    reason="Reference-only answers are not acceptable; provide substantive text.",
-                    details={"reference_only": True},
-                )
-
-        # Disallow refusal-style answers where the template says refusal is not acceptable.
-        if expected_disallow_refusal(expected) and REFUSAL_PAT.search(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Refusal-style answers are not acceptable for this question.",
-                details={"refusal": True},
+    # Searched once here for both the sheet rule below and the generic NEEDS_EVIDENCE fallback.
+    has_ref = bool(REFERENCE_PAT.search(a_lower))
+
+    if sheet_kind & _NO_REFERENCE_SHEETS and eflags & (EXP_NO_REFERENCE | EXP_NO_REFUSAL):
+        ref_hit = has_ref and bool(eflags & EXP_NO_REFERENCE)
+        refusal_hit = bool(eflags & EXP_NO_REFUSAL) and bool(REFUSAL_PAT.search(a_lower))
+
+        # Fondsmanagement sheets accept references to a policy; the other sheets do not,
+        # but on those the refusal check comes first.
+        policy_ok = bool(sheet_kind & SHEET_FONDS) and "policy" in a_lower
+        if ref_hit and not policy_ok:
+            return _reference_only(row)
+        if refusal_hit:
+            return _finding(
+                row,
+                "REJECTED",
+                "Refusal-style answers are not acceptable for this question.",
+                {"refusal": True},
             )
-
-    if is_regta_sheet(row.sheet):
-        if expected_disallow_reference(expected) and detect_reference(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Reference-only answers are not acceptable; provide substantive text.",
-                details={"reference_only": True},
+        if ref_hit and sheet_kind & _NO_REFERENCE_SHEETS & ~SHEET_FONDS:
+            return _reference_only(row)
+
+    if sheet_kind & SHEET_INNENREVISION:
+        if eflags & EXP_NUMBER_AND_TEXT and not has_number_and_text(answer):
+            return _finding(
+                row,
+                "INCOMPLETE",
+                "Expected both a number and descriptive text.",
+                {"expected": "number+text"},
             )
 
-        if expected_disallow_refusal(expected) and REFUSAL_PAT.search(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Refusal-style answers are not acceptable for this question.",
-                details={"refusal": True},
-            )
-
-    if is_zv_fobu_sheet(row.sheet):
-        if expected_disallow_reference(expected) and detect_reference(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Reference-only answers are not acceptable; provide substantive text.",
-                details={"reference_only": True},
-            )
-
-        if expected_disallow_refusal(expected) and REFUSAL_PAT.search(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Refusal-style answers are not acceptable for this question.",
-                details={"refusal": True},
-            )
-
-    if is_verwahrstelle_sheet(row.sheet):
-        if expected_disallow_reference(expected) and detect_reference(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Reference-only answers are not acceptable; provide substantive text.",
-                details={"reference_only": True},
-            )
-
-        if expected_disallow_refusal(expected) and REFUSAL_PAT.search(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="REJECTED",
-                reason="Refusal-style answers are not acceptable for this question.",
-                details={"refusal": True},
-            )
-
-    if is_innenrevision_sheet(row.sheet):
-        if expected_requires_number_and_text(expected) and not has_number_and_text(answer):
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="INCOMPLETE",
-                reason="Expected both a number and descriptive text.",
-                details={"expected": "number+text"},
-            )
-
-    if detect_reference(answer):
-        return Finding(
-            sheet=row.sheet,
-            row_idx=row.row_idx,
-            question_id=row.question_id,
-            question_text=row.question_text,
-            answer_text=row.answer_text,
-            expected_text=row.expected_text,
-            status="NEEDS_EVIDENCE",
-            reason="Answer references an attachment/section; requires document evidence retrieval.",
-            details={"reference_detected": True},
+    if has_ref:
+        return _finding(
+            row,
+            "NEEDS_EVIDENCE",
+            "Answer references an attachment/section; requires document evidence retrieval.",
+            {"reference_detected": True},
         )
 
-    yn = expected_yes_no(expected)
-    if yn == "YES" and not YES_PAT.search(answer):
-        return Finding(
-            sheet=row.sheet,
-            row_idx=row.row_idx,
-            question_id=row.question_id,
-            question_text=row.question_text,
-            answer_text=row.answer_text,
-            expected_text=row.expected_text,
-            status="INCOMPLETE",
-            reason="Expected a 'Yes/Confirmed' style answer based on model answer.",
-            details={"expected": "YES"},
+    if eflags & EXP_YES and not YES_PAT.search(answer):
+        return _finding(
+            row,
+            "INCOMPLETE",
+            "Expected a 'Yes/Confirmed' style answer based on model answer.",
+            {"expected": "YES"},
         )
-    if yn == "NO" and not NO_PAT.search(answer):
-        return Finding(
-            sheet=row.sheet,
-            row_idx=row.row_idx,
-            question_id=row.question_id,
-            question_text=row.question_text,
-            answer_text=row.answer_text,
-            expected_text=row.expected_text,
-            status="INCOMPLETE",
-            reason="Expected a 'No' style answer based on model answer.",
-            details={"expected": "NO"},
+    if eflags & EXP_NO and not NO_PAT.search(answer):
+        return _finding(
+            row,
+            "INCOMPLETE",
+            "Expected a 'No' style answer based on model answer.",
+            {"expected": "NO"},
         )
 
     # Descriptive answers
-    if ("[text]" in expected.lower()) or re.search(r"\b(beschreiben|erläutern|detaillieren)\b", row.question_text, re.I):
+    if eflags & EXP_TEXT or DESCRIBE_PAT.search(q_lower):
         if len(answer) < cfg.min_len_descriptive:
-            return Finding(
-                sheet=row.sheet,
-                row_idx=row.row_idx,
-                question_id=row.question_id,
-                question_text=row.question_text,
-                answer_text=row.answer_text,
-                expected_text=row.expected_text,
-                status="INCOMPLETE",
-                reason=f"Answer is too short for a descriptive question (min {cfg.min_len_descriptive} chars).",
-                details={"min_len": cfg.min_len_descriptive, "actual_len": len(answer)},
+            return _finding(
+                row,
+                "INCOMPLETE",
+                f"Answer is too short for a descriptive question (min {cfg.min_len_descriptive} chars).",
+                {"min_len": cfg.min_len_descriptive, "actual_len": len(answer)},
             )
 
     return None
+
+
+_SKIPPED_REASON = "Row is not a question or validation rule does not apply."
+_OK_REASON = "Passed rule checks."
+# Shared by all SKIPPED / OK findings, so treat them as read-only. Nothing mutates `details`
+# in place (LLM refinement only touches flagged findings and assigns a new dict).
+_SKIPPED_DETAILS = {"validated": False}
+_OK_DETAILS = {"validated": True}
+
+
+def validate_rows(rows: Sequence[QuestionRow], cfg: RuleConfig) -> List[Finding]:
+    """Validate `rows` in-process and return one Finding per row (SKIPPED / OK / flagged)."""
+
+    results: List[Optional[Finding]] = [None] * len(rows)
+    for i, row in enumerate(rows):
+        ctx = _row_context(row)
+        if not _should_validate(ctx):
+            results[i] = _finding(row, "SKIPPED", _SKIPPED_REASON, _SKIPPED_DETAILS)
+            continue
+
+        fnd = _check_row(row, ctx, cfg)
+        if fnd is None:
+            fnd = _finding(row, "OK", _OK_REASON, _OK_DETAILS)
+        results[i] = fnd
+    return results
+
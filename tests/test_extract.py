@@ -0,0 +1,74 @@
+import random
+import re
+import unittest
+
+from ddq_validator.extract import _iter_qid_chunks, _question_and_answer
+
+
+# The original whole-text extraction, kept verbatim as the reference output.
+def _reference_qid_chunks(pages):
+    text = re.sub(r"[ \t]+", " ", "\n".join(pages))
+    pattern = re.compile(r"\b(\d+(?:\.\d+)+)\b")
+    matches = list(pattern.finditer(text))
+    chunks = []
+    for i, m in enumerate(matches):
+        qid = m.group(1)
+        start = m.end()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        chunks.append((qid, text[start:end].strip()))
+    return chunks
+
+
+def _reference_question_and_answer(chunk):
+    lines = [l.strip() for l in chunk.splitlines() if l.strip()]
+    if not lines:
+        return "", ""
+    if len(lines) == 1:
+        return "", lines[0]
+    return lines[0], lines[-1]
+
+
+_WORDS = [
+    "1.1", "4.1.9", "2.10", "12", "v1.2a", "Is there a policy?", "Yes", "No", "siehe Anhang",
+    "n/a", " ", "\t", "\n", "\r\n", "\x0c", "\x0b", "\x1c", "\xa0", "\u2028", "\x85", ".", "",
+]
+
+
+def _random_text(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice(_WORDS) + rng.choice(["", " ", "\n"]) for _ in range(n))
+
+
+class IterQidChunksTest(unittest.TestCase):
+    def test_matches_whole_text_reference(self):
+        rng = random.Random(0)
+        for _ in range(5000):
+            pages = [_random_text(rng, rng.randint(0, 8)) for _ in range(rng.randint(0, 4))]
+            self.assertEqual(list(_iter_qid_chunks(pages)), _reference_qid_chunks(pages), pages)
+
+    def test_chunk_continues_on_next_page(self):
+        pages = ["1.1 Question one\nYes\n1.2 Question", "two continued\nNo"]
+        self.assertEqual(
+            list(_iter_qid_chunks(pages)),
+            [("1.1", "Question one\nYes"), ("1.2", "Question\ntwo continued\nNo")],
+        )
+
+
+class QuestionAndAnswerTest(unittest.TestCase):
+    def test_matches_per_line_reference(self):
+        rng = random.Random(0)
+        for _ in range(20000):
+            chunk = _random_text(rng, rng.randint(0, 10)).strip()
+            self.assertEqual(_question_and_answer(chunk), _reference_question_and_answer(chunk), chunk)
+
+    def test_chunks_from_splitter(self):
+        rng = random.Random(1)
+        for _ in range(2000):
+            pages = [_random_text(rng, rng.randint(0, 8)) for _ in range(rng.randint(1, 3))]
+            for _, chunk in _iter_qid_chunks(pages):
+                self.assertEqual(
+                    _question_and_answer(chunk), _reference_question_and_answer(chunk), chunk
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
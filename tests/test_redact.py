@@ -0,0 +1,62 @@
+import random
+import re
+import unittest
+
+from ddq_validator.redact import redact_names
+
+
+# The original three-pass redaction, kept verbatim as the reference output.
+_REF_LABEL_RE = re.compile(
+    r"(?i)\b(name|contact|prepared by|author|signed by|signatory|respondent)\b\s*[:\-]\s*"
+    r"([A-Z][a-z]+(?:[\s\-'\.][A-Z][a-z]+){0,3})"
+)
+_REF_TITLE_RE = re.compile(
+    r"\b(Mr|Ms|Mrs|Dr|Prof)\.?\s+([A-Z][a-z]+(?:[\s\-'\.][A-Z][a-z]+){0,3})"
+)
+_REF_BY_FROM_RE = re.compile(
+    r"(?i)\b(by|from|attn|attention)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})"
+)
+_REF_GENERAL_NAME_RE = re.compile(
+    r"\b([A-ZÄÖÜ][a-zäöü]+(?:[-'][A-ZÄÖÜa-zäöü]+)*)"
+    r"(?:\s+([A-ZÄÖÜ][a-zäöü]+(?:[-'][A-ZÄÖÜa-zäöü]+)*)){1,3}\b"
+)
+
+
+def _reference_redact(text: str) -> str:
+    if not text:
+        return text
+    text = _REF_LABEL_RE.sub(lambda m: f"{m.group(1)}: [REDACTED]", text)
+    text = _REF_TITLE_RE.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
+    text = _REF_BY_FROM_RE.sub(lambda m: f"{m.group(1)} [REDACTED]", text)
+    text = _REF_GENERAL_NAME_RE.sub("[REDACTED]", text)
+    return text
+
+
+class RedactNamesTest(unittest.TestCase):
+    def test_title_after_by_from_is_fully_redacted(self):
+        cases = {
+            "Sent by Compliance Officer Dr. Weber": "Sent by [REDACTED] [REDACTED]",
+            "Forwarded from Head Office Mr. Smith": "Forwarded from [REDACTED] [REDACTED]",
+            "John From and Mr. Jean-Luc": "[REDACTED] [REDACTED] [REDACTED]",
+        }
+        for text, expected in cases.items():
+            self.assertEqual(redact_names(text), expected)
+
+    def test_non_breaking_space(self):
+        self.assertEqual(redact_names("Contact:\xa0Weber"), "Contact: [REDACTED]")
+        self.assertEqual(redact_names("Dr.\xa0Weber"), "Dr [REDACTED]")
+
+    def test_matches_three_pass_reference(self):
+        words = [
+            "Name:", "contact -", "Prepared by", "signed by:", "Dr.", "Mr", "Prof", "by", "From",
+            "attn", "Attention", "Weber", "Jean-Luc", "O'Neil", "Max", "Mustermann", "Head", "Office",
+            "Müller", "siehe", "Anhang", "4.1.9", "the", "and", "\xa0", "\n", ".", "-",
+        ]
+        rng = random.Random(0)
+        for _ in range(20000):
+            text = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+            self.assertEqual(redact_names(text), _reference_redact(text), text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from ddq_validator.models import QuestionRow
+from ddq_validator.rules import RuleConfig, contains_forbidden, validate_rows
+
+
+# The original token list and list-order lookup, kept verbatim as the reference output.
+_REF_TOKENS = [
+    "n/a", "n.a", "na", "not applicable", "tbd", "to be defined", "later", "unknown", "k.a",
+    "keine angabe",
+]
+
+
+def _reference_contains_forbidden(answer):
+    a = (answer or "").strip().lower()
+    for t in _REF_TOKENS:
+        if t in a:
+            return t
+    return None
+
+
+class ForbiddenTokenTest(unittest.TestCase):
+    def test_reports_token_that_occurs_first(self):
+        cfg = RuleConfig.default()
+        answer = "Hinweis tbd Signature"
+        self.assertEqual(_reference_contains_forbidden(answer), "na")
+        self.assertEqual(contains_forbidden(answer, cfg), "tbd")
+
+    def test_row_status_is_unchanged(self):
+        row = QuestionRow(
+            sheet="Fonds",
+            row_idx=7,
+            question_id="4.1.9",
+            question_text="Describe your AML policy?",
+            answer_text="Hinweis tbd Signature",
+            expected_text="Obligatory",
+        )
+        (finding,) = validate_rows([row], RuleConfig.default())
+        self.assertEqual(finding.status, "REJECTED")
+        self.assertEqual(finding.details, {"forbidden": "tbd"})
+        self.assertEqual(finding.reason, "Answer contains forbidden placeholder: 'tbd'.")
+
+
+if __name__ == "__main__":
+    unittest.main()